@@ -4,7 +4,9 @@
 
 import datetime
 import os
+import time
 import warnings
+from functools import lru_cache
 from string import Template
 
 import pandas as pd
@@ -22,6 +24,8 @@ from pyBiodatafuse.utils import (
     check_columns_against_constants,
     collapse_data_sources,
     get_identifier_of_interest,
+    load_query,
+    run_sparql_queries,
 )
 
 
@@ -30,8 +34,7 @@ def check_endpoint_bgee() -> bool:
 
     :returns: True if the endpoint is available, False otherwise.
     """
-    with open(os.path.dirname(__file__) + "/queries/bgee-get-last-modified.rq", "r") as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(os.path.dirname(__file__) + "/queries/bgee-get-last-modified.rq")
 
     sparql = SPARQLWrapper(BGEE_ENDPOINT)
     sparql.setReturnFormat(JSON)
@@ -45,6 +48,7 @@ def check_endpoint_bgee() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
 def get_version_bgee() -> dict:
     """Get version of Bgee RDF data from its SPARQL endpoint.
 
@@ -52,8 +56,7 @@ def get_version_bgee() -> dict:
     # http://purl.org/dc/terms/modified
     :returns: a dictionary containing the last modified date information
     """
-    with open(os.path.dirname(__file__) + "/queries/bgee-get-last-modified.rq", "r") as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(os.path.dirname(__file__) + "/queries/bgee-get-last-modified.rq")
 
     sparql = SPARQLWrapper(BGEE_ENDPOINT)
     sparql.setReturnFormat(JSON)
@@ -65,14 +68,15 @@ def get_version_bgee() -> dict:
     return bgee_version
 
 
-def get_gene_expression(bridgedb_df: pd.DataFrame):
+def get_gene_expression(bridgedb_df: pd.DataFrame, check_endpoint: bool = True):
     """Query gene-tissue expression information from Bgee.
 
     :param bridgedb_df: BridgeDb output for creating the list of gene ids to query
+    :param check_endpoint: whether to check the availability of the Bgee SPARQL endpoint first
     :returns: a DataFrame containing the Bgee output and dictionary of the Bgee metadata.
     """
     # Check if the Bgee SPARQL endpoint is available
-    api_available = check_endpoint_bgee()
+    api_available = not check_endpoint or check_endpoint_bgee()
 
     if not api_available:
         warnings.warn(
@@ -82,8 +86,8 @@ def get_gene_expression(bridgedb_df: pd.DataFrame):
 
     # Extract the "target" values and join them into a single string separated by commas
     data_df = get_identifier_of_interest(bridgedb_df, BGEE_INPUT_ID)
-    gene_list = data_df["target"].tolist()
-    gene_list = list(set(gene_list))
+    # Drop duplicated genes while keeping the input order, so the queries are reproducible
+    gene_list = list(dict.fromkeys(data_df["target"].tolist()))
 
     query_gene_lists = []
     if len(gene_list) > 25:
@@ -94,72 +98,67 @@ def get_gene_expression(bridgedb_df: pd.DataFrame):
     else:
         query_gene_lists.append(" ".join(f'"{g}"' for g in gene_list))
 
-    anatomical_entities_list = ANATOMICAL_ENTITIES_LIST.split("\n")
+    # for the query text, need to put each name in between quotes
+    anatomical_entities_str = " ".join(
+        f'"{anatomical_entity}"' for anatomical_entity in ANATOMICAL_ENTITIES_LIST.split("\n")
+    )
 
-    with open(
-        os.path.dirname(__file__) + "/queries/bgee-genes-tissues-expression-level.rq", "r"
-    ) as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(
+        os.path.dirname(__file__) + "/queries/bgee-genes-tissues-expression-level.rq"
+    )
+    sparql_query_template = Template(sparql_query)
 
     # Add version to metadata file
     bgee_version = get_version_bgee()
 
     # Record the start time
-    start_time = datetime.datetime.now()
-
-    sparql = SPARQLWrapper(BGEE_ENDPOINT)
-    sparql.setReturnFormat(JSON)
-
-    query_count = 0
-
-    intermediate_df = pd.DataFrame()
+    start_time = time.perf_counter()
 
+    queries = []
     for gene_list_str in query_gene_lists:
-        query_count += 1
-
-        gene_ids = gene_list_str.split(" ")
-
-        for gene_id in gene_ids:
-            sparql_query_template = Template(sparql_query)
-
-            for anatomical_entity in anatomical_entities_list:
-                # for the query text, need to put each name in between quotes
-                anatomical_entity = f'"{anatomical_entity}"'
-                substit_dict = dict(gene_list=gene_id, anat_entities_list=anatomical_entity)
-                sparql_query_template_sub = sparql_query_template.substitute(substit_dict)
-
-                sparql.setQuery(sparql_query_template_sub)
-                res = sparql.queryAndConvert()
-
-                df = pd.DataFrame(res["results"]["bindings"])
+        substit_dict = dict(gene_list=gene_list_str, anat_entities_list=anatomical_entities_str)
+        queries.append(sparql_query_template.substitute(substit_dict))
+
+    results = run_sparql_queries(
+        BGEE_ENDPOINT,
+        queries,
+        dtypes={
+            "ensembl_id": str,
+            "anatomical_entity_id": str,
+            "anatomical_entity_name": str,
+            "developmental_stage_id": str,
+            "developmental_stage_name": str,
+            "expression_level": float,
+            "confidence_level_id": str,
+            "confidence_level_name": str,
+        },
+    )
 
-                df = df.applymap(lambda x: x["value"], na_action="ignore")
-                if df.empty:
-                    continue
+    intermediate_dfs = [df for df in results if not df.empty]
 
-                df.drop_duplicates(
-                    subset=["anatomical_entity_id", "developmental_stage_id"], inplace=True
-                )
-                intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)
+    intermediate_df = (
+        pd.concat(intermediate_dfs, ignore_index=True, copy=False)
+        if intermediate_dfs
+        else pd.DataFrame()
+    )
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "anatomical_entity_id" not in intermediate_df:
         return pd.DataFrame(), {"datasource": BGEE, "metadata": bgee_version}
 
     # Organize the annotation results as an array of dictionaries
     intermediate_df.rename(columns={"ensembl_id": "target"}, inplace=True)
-    intermediate_df["anatomical_entity_id"] = intermediate_df["anatomical_entity_id"].apply(
-        lambda x: x.split("/")[-1]
+    intermediate_df = intermediate_df.drop_duplicates(
+        subset=["target", "anatomical_entity_id", "developmental_stage_id"], ignore_index=True
     )
-    intermediate_df["developmental_stage_id"] = intermediate_df["developmental_stage_id"].apply(
-        lambda x: x.split("/")[-1]
-    )
-    intermediate_df["confidence_level_id"] = intermediate_df["confidence_level_id"].apply(
-        lambda x: x.split("/")[-1]
-    )
-    intermediate_df["expression_level"] = pd.to_numeric(intermediate_df["expression_level"])
+    for col in ["anatomical_entity_id", "developmental_stage_id", "confidence_level_id"]:
+        # Only a handful of distinct IRIs are returned, so strip each of them once
+        iris = intermediate_df[col].unique()
+        intermediate_df[col] = intermediate_df[col].map(
+            {iri: iri.rsplit("/", 1)[-1] for iri in iris}
+        )
 
     # Check if all keys in df match the keys in OUTPUT_DICT
     check_columns_against_constants(
@@ -168,6 +167,17 @@ def get_gene_expression(bridgedb_df: pd.DataFrame):
         check_values_in=["anatomical_entity_id", "developmental_stage_id", "confidence_level_id"],
     )
 
+    # Few distinct tissues, stages and confidence levels are repeated over all genes
+    for col in [
+        "anatomical_entity_id",
+        "anatomical_entity_name",
+        "developmental_stage_id",
+        "developmental_stage_name",
+        "confidence_level_id",
+        "confidence_level_name",
+    ]:
+        intermediate_df[col] = intermediate_df[col].astype("category")
+
     # Merge the two DataFrames on the target column
     merged_df = collapse_data_sources(
         data_df=data_df,
@@ -183,7 +193,7 @@ def get_gene_expression(bridgedb_df: pd.DataFrame):
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     bgee_metadata = {
@@ -5,6 +5,7 @@
 import datetime
 import logging
 import os
+import time
 import warnings
 from string import Template
 from typing import Tuple
@@ -108,7 +109,7 @@ def get_gene_disease(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
 
     # Record the start time
     disgenet_version = get_version_disgenet()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     sparql = SPARQLWrapper(DISGENET_ENDPOINT)
     sparql.setReturnFormat(JSON)
@@ -133,7 +134,7 @@ def get_gene_disease(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
         )  # this is also adding to the time
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Organize the annotation results as an array of dictionaries
     if "gene_id" not in intermediate_df:
@@ -177,7 +178,7 @@ def get_gene_disease(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     disgenet_metadata = {
         "datasource": DISGENET,
@@ -3,11 +3,16 @@
 """Python file for queriying the MINERVA platform (https://minerva.pages.uni.lu/doc/)."""
 
 import datetime
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pyBiodatafuse.constants import MINERVA, MINERVA_ENDPOINT, MINERVA_INPUT_ID, MINERVA_OUTPUT_DICT
 from pyBiodatafuse.utils import (
@@ -16,13 +21,25 @@ from pyBiodatafuse.utils import (
     get_identifier_of_interest,
 )
 
+# Shared session so that the connections to the MINERVA instances are pooled and reused
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3)
+    ),
+)
+
+# MINERVA version of each map when its components were last downloaded
+_MAP_VERSIONS: dict = {}
+
 
 def check_endpoint_minerva() -> bool:
     """Check the availability of the MINERVA API endpoint.
 
     :returns: True if the endpoint is available, False otherwise.
     """
-    response = requests.get(f"{MINERVA_ENDPOINT}/machines/")
+    response = _SESSION.get(f"{MINERVA_ENDPOINT}/machines/")
 
     # Check if API is down
     if response.status_code == 200:
@@ -37,7 +54,7 @@ def get_version_minerva(map_endpoint: str) -> dict:
     :param map_endpoint: MINERVA map API endpoint (eg. "https://covid19map.elixir-luxembourg.org/minerva/")
     :returns: a dictionary containing the version information
     """
-    response = requests.get(map_endpoint + "api/configuration/")
+    response = _SESSION.get(map_endpoint + "api/configuration/")
 
     conf_dict = response.json()
     minerva_version = {"source_version": conf_dict["version"]}
@@ -51,33 +68,32 @@ def list_projects() -> pd.DataFrame:
     :returns: a dataFrame containing url, names and IDs from the different projects in MINERVA plattform
     """
     base_endpoint = f"{MINERVA_ENDPOINT}/machines/"
-    projects = requests.get(base_endpoint).json()
+
+    projects = _SESSION.get(base_endpoint).json()
     projects_ids = projects["pageContent"]
 
-    project_df = pd.DataFrame()
+    project_df = pd.DataFrame(
+        [{"url": x["rootUrl"], "id": x["id"]} for x in projects_ids], columns=["url", "id"]
+    )
 
-    for x in projects_ids:
-        entry = {"url": x["rootUrl"], "id": x["id"]}
-        entry_df = pd.DataFrame([entry])
-        project_df = pd.concat([project_df, entry_df], ignore_index=True)
+    # Request the projects of every machine concurrently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        machine_projects = list(
+            executor.map(
+                lambda x: _SESSION.get(f"{base_endpoint}/{x}/projects/").json()["pageContent"],
+                project_df["id"],
+            )
+        )
 
     map_id_list = []
     names_list = []
-    for x in project_df["id"]:
-        x = str(x)
-        if len(requests.get(f"{base_endpoint}/{x}/projects/").json()["pageContent"]) != 0:
-            map_id = requests.get(f"{base_endpoint}/{x}/projects/").json()["pageContent"][0][
-                "projectId"
-            ]
-            name = requests.get(f"{base_endpoint}/{x}/projects/").json()["pageContent"][0][
-                "mapName"
-            ]
-            map_id_list.append(map_id)
-            names_list.append(name)
-        else:
-            project_df = project_df[
-                project_df["id"] != int(x)
-            ]  # If pageContent is not present, then delete this entry
+    for page_content in machine_projects:
+        if len(page_content) != 0:
+            map_id_list.append(page_content[0]["projectId"])
+            names_list.append(page_content[0]["mapName"])
+
+    # If pageContent is not present, then delete this entry
+    project_df = project_df[[len(page_content) != 0 for page_content in machine_projects]]
 
     project_df["map_id"] = map_id_list
     project_df["names"] = names_list
@@ -85,6 +101,7 @@ def list_projects() -> pd.DataFrame:
     return project_df
 
 
+@lru_cache(maxsize=16)
 def get_minerva_components(
     map_name: str,
     get_elements: Optional[bool] = True,
@@ -92,6 +109,9 @@ def get_minerva_components(
 ) -> Tuple[str, dict]:
     """Get information about MINERVA componenets from a specific project.
 
+    The components are cached per map and options. Use `get_minerva_components.cache_clear()`
+    to download them again. The returned dictionary is shared between calls, so do not modify it.
+
     :param map_name: MINERVA map name. The extensive list can be found at https://minerva-net.lcsb.uni.lu/table.html.
     :param get_elements: boolean to get elements of the chosen diagram
     :param get_reactions: boolean to get reactions of the chosen diagram
@@ -113,48 +133,32 @@ def get_minerva_components(
     project_id = project_df.loc[row, "map_id"].to_string(index=False, header=False)
 
     # Request project data using the extracted project ID
-    response = requests.get(map_url + "/api/projects/" + project_id + "/models/")
+    response = _SESSION.get(map_url + "/api/projects/" + project_id + "/models/")
 
     models = (
         response.json()
     )  # pull down only models and then iterate over them to extract element of interest
     map_components = {"models": models}
 
-    if get_elements:
-        # Get elements of the chosen diagram
-        model_elements = {}
-        for model in models:
-            model = str(model["idObject"])
-            url_complete = (
-                map_url
-                + "api/projects/"
-                + project_id
-                + "/models/"
-                + model
-                + "/"
-                + "bioEntities/elements/"
+    model_ids = [str(model["idObject"]) for model in models]
+    models_url = map_url + "api/projects/" + project_id + "/models/"
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        if get_elements:
+            # Get elements of the chosen diagram
+            model_elements = executor.map(
+                lambda model: _SESSION.get(models_url + model + "/bioEntities/elements/").json(),
+                model_ids,
             )
-            response_data = requests.get(url_complete)
-            model_elements[model] = response_data.json()
-        map_components["map_elements"] = model_elements
-
-    if get_reactions:
-        # Get reactions of the chosen diagram
-        model_reactions = {}
-        for model in models:
-            model = str(model["idObject"])
-            url_complete = (
-                map_url
-                + "api/projects/"
-                + project_id
-                + "/models/"
-                + model
-                + "/"
-                + "bioEntities/reactions/"
+            map_components["map_elements"] = dict(zip(model_ids, model_elements))
+
+        if get_reactions:
+            # Get reactions of the chosen diagram
+            model_reactions = executor.map(
+                lambda model: _SESSION.get(models_url + model + "/bioEntities/reactions/").json(),
+                model_ids,
             )
-            response_data = requests.get(url_complete)
-            model_reactions[model] = response_data.json()
-        map_components["map_reactions"] = model_reactions
+            map_components["map_reactions"] = dict(zip(model_ids, model_reactions))
 
     return map_url, map_components
 
@@ -164,7 +168,7 @@ def get_gene_minerva_pathways(
     map_name: str,
     input_type: Optional[str] = "Protein",
     get_elements: Optional[bool] = True,
-    get_reactions: Optional[bool] = True,
+    get_reactions: Optional[bool] = False,
 ) -> Tuple[pd.DataFrame, dict]:
     """Get information about MINERVA pathways associated with a gene.
 
@@ -173,7 +177,8 @@ def get_gene_minerva_pathways(
         can be found at https://minerva-net.lcsb.uni.lu/table.html.
     :param input_type: type of input gene. Default is "Protein"
     :param get_elements: boolean to get elements of the chosen diagram
-    :param get_reactions: if get_reactions = boolean to get reactions of the chosen diagram
+    :param get_reactions: boolean to get reactions of the chosen diagram. They are not used in the
+        annotation, so they are only downloaded when requested. Default is False
     :returns: a tuple containing MINERVA outputs and dictionary of the MINERVA metadata.
     """
     # Check if the MINERVA API is available
@@ -199,68 +204,52 @@ def get_gene_minerva_pathways(
     data_df = get_identifier_of_interest(bridgedb_df, MINERVA_INPUT_ID)
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     map_url, map_components = get_minerva_components(
         map_name=map_name, get_elements=get_elements, get_reactions=get_reactions
     )
     minerva_version = get_version_minerva(map_endpoint=map_url)
 
+    # Download the components again if MINERVA was updated since they were cached
+    if _MAP_VERSIONS.get(map_name, minerva_version) != minerva_version:
+        get_minerva_components.cache_clear()
+        map_url, map_components = get_minerva_components(
+            map_name=map_name, get_elements=get_elements, get_reactions=get_reactions
+        )
+    _MAP_VERSIONS[map_name] = minerva_version
+
     map_elements = map_components.get("map_elements", {})
     models = map_components.get("models", {})
 
-    names = []
-    for value in models:
-        name = value["name"]
-        names.append(name)
-
-    intermediate_df = pd.DataFrame()
-
-    for idx, pathway_name in enumerate(names):
-        pathway_data = list(map_elements.values())[idx]
-        interested_info = ["type", "references", "symbol", "name", "ensembl"]
-
-        # Initialize empty lists to store values for each common key
-        entity_type = []
-        refs = []
-        symbol = []
-        ensembl = []
-
-        # Iterate through the list of dicts
-        for data in pathway_data:
-            for col in interested_info:
-                if col not in data:
-                    continue
-
-                value = data[col]
-
-                if col == "type":
-                    entity_type.append(value)
-                elif col == "symbol":
-                    symbol.append(value)
-                elif col == "references":
-                    refs.append(value)
-
-                    ensembl_id = None
-                    for p in value:
-                        if p["type"] == "ENSEMBL":
-                            ensembl_id = p["resource"]
-                    ensembl.append(ensembl_id)
-
-        data = pd.DataFrame()
-        data["symbol"] = symbol
-        data["pathway_label"] = pathway_name
-        data["pathway_gene_count"] = len(symbol) - symbol.count(None)
-        data["pathway_id"] = models[idx]["idObject"]
-        data["refs"] = refs
-        data["ensembl"] = ensembl
-        data["type"] = entity_type
-
-        intermediate_df = pd.concat([intermediate_df, data], ignore_index=True)
-        intermediate_df = intermediate_df[intermediate_df["type"] == input_type]
+    intermediate_dfs = []
+
+    for model in models:
+        pathway_data = map_elements.get(str(model["idObject"]), [])
+
+        data = pd.DataFrame(pathway_data, columns=["symbol", "references", "type"])
+        data.rename(columns={"references": "refs"}, inplace=True)
+        data["pathway_label"] = model["name"]
+        data["pathway_gene_count"] = data["symbol"].notna().sum()
+        data["pathway_id"] = model["idObject"]
+        # Keep the last ENSEMBL identifier listed in the references of each element
+        data["ensembl"] = data["refs"].map(
+            lambda refs: next(
+                (ref["resource"] for ref in reversed(refs) if ref["type"] == "ENSEMBL"), None
+            )
+        )
+
+        # Only keep the elements of the requested type
+        intermediate_dfs.append(data.loc[data["type"] == input_type])
+
+    intermediate_df = (
+        pd.concat(intermediate_dfs, ignore_index=True, copy=False)
+        if intermediate_dfs
+        else pd.DataFrame()
+    )
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "symbol" not in intermediate_df:
         return pd.DataFrame(), {"datasource": MINERVA, "metadata": minerva_version}
@@ -280,6 +269,10 @@ def get_gene_minerva_pathways(
         check_values_in=["pathway_id"],
     )
 
+    # Pathways are shared by many genes, so store them as categories
+    for col in ["pathway_id", "pathway_label"]:
+        intermediate_df[col] = intermediate_df[col].astype("category")
+
     # Merge the two DataFrames on the target column
     merged_df = collapse_data_sources(
         data_df=data_df,
@@ -294,7 +287,7 @@ def get_gene_minerva_pathways(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     minerva_metadata = {
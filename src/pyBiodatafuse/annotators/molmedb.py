@@ -5,6 +5,7 @@
 
 import datetime
 import os
+import time
 import warnings
 from string import Template
 from typing import Tuple
@@ -65,7 +66,7 @@ def get_gene_compound_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
         return pd.DataFrame(), {}
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     data_df = get_identifier_of_interest(bridgedb_df, MOLMEDB_GENE_INPUT_ID)
     molmedb_transporter_list = data_df["target"].tolist()
@@ -112,7 +113,7 @@ def get_gene_compound_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
         intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)  # adds to the time
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "transporterID" not in intermediate_df.columns:
         return pd.DataFrame(), {"datasource": MOLMEDB, "metadata": ""}
@@ -194,7 +195,7 @@ def get_gene_compound_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     molmedb_metadata = {
@@ -223,7 +224,7 @@ def get_compound_gene_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
         return pd.DataFrame(), {}
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     data_df = get_identifier_of_interest(bridgedb_df, MOLMEDB_COMPOUND_INPUT_ID)
     inhibitor_list_str = data_df["target"].tolist()
@@ -270,7 +271,7 @@ def get_compound_gene_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
         intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)  # adds to the time
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "inhibitorInChIKey" not in intermediate_df.columns:
         return pd.DataFrame(), {"datasource": MOLMEDB, "metadata": ""}
@@ -304,7 +305,7 @@ def get_compound_gene_inhibitor(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFrame
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     molmedb_metadata = {
@@ -4,6 +4,7 @@
 
 import datetime
 import math
+import time
 import warnings
 from typing import Tuple
 
@@ -126,7 +127,7 @@ def get_gene_location(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = """
       query targetLocation {
@@ -145,7 +146,7 @@ def get_gene_location(
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Generate the OpenTargets DataFrame
     intermediate_df = pd.DataFrame()
@@ -192,7 +193,7 @@ def get_gene_location(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
@@ -227,7 +228,7 @@ def get_gene_go_process(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = """
       query targetPathways {
@@ -248,7 +249,7 @@ def get_gene_go_process(
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Generate the OpenTargets DataFrame
     intermediate_df = pd.DataFrame()
@@ -294,7 +295,7 @@ def get_gene_go_process(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
@@ -329,7 +330,7 @@ def get_gene_reactome_pathways(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = """
       query targetPathways {
@@ -347,7 +348,7 @@ def get_gene_reactome_pathways(
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Generate the OpenTargets DataFrame
     intermediate_df = pd.DataFrame()
@@ -386,7 +387,7 @@ def get_gene_reactome_pathways(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
@@ -437,14 +438,14 @@ def get_gene_tractability(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = query_string.replace("$ids", str(gene_ids).replace("'", '"'))
 
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     intermediate_df = pd.DataFrame()
 
@@ -467,7 +468,7 @@ def get_gene_tractability(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
@@ -502,7 +503,7 @@ def get_gene_compound_interactions(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = """
       query targetDrugs {
@@ -533,7 +534,7 @@ def get_gene_compound_interactions(
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     intermediate_df = pd.DataFrame()
 
@@ -611,7 +612,7 @@ def get_gene_compound_interactions(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
@@ -646,7 +647,7 @@ def get_gene_disease_associations(
 
     # Record the start time
     opentargets_version = get_version_opentargets()
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     query_string = """
       query targetDiseases {
@@ -673,7 +674,7 @@ def get_gene_disease_associations(
     r = requests.post(OPENTARGETS_ENDPOINT, json={"query": query_string}).json()
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     intermediate_df = pd.DataFrame()
 
@@ -733,7 +734,7 @@ def get_gene_disease_associations(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add version, datasource, query, query time, and the date to metadata
     opentargets_version["query"] = {
         "size": len(gene_ids),
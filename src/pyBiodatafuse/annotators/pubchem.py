@@ -5,6 +5,7 @@
 
 import datetime
 import os
+import time
 import warnings
 from string import Template
 from typing import Tuple
@@ -64,7 +65,7 @@ def get_protein_molecule_screened(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFra
         return pd.DataFrame(), {}
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     data_df = get_identifier_of_interest(bridgedb_df, PUBCHEM_INPUT_ID)
     protein_list_str = data_df["target"].tolist()
@@ -112,7 +113,7 @@ def get_protein_molecule_screened(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFra
         intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Organize the annotation results as an array of dictionaries
     assay_endpoint_types = {
@@ -187,7 +188,7 @@ def get_protein_molecule_screened(bridgedb_df: pd.DataFrame) -> Tuple[pd.DataFra
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     molmedb_metadata = {
@@ -5,6 +5,7 @@
 
 import datetime
 import logging
+import time
 import warnings
 
 import pandas as pd
@@ -116,7 +117,7 @@ def get_ppi(bridgedb_df: pd.DataFrame):
     string_version = get_version_stringdb()
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     data_df = get_identifier_of_interest(bridgedb_df, "Ensembl")
     data_df = data_df.reset_index(drop=True)
@@ -139,7 +140,7 @@ def get_ppi(bridgedb_df: pd.DataFrame):
     data_df[STRING] = data_df.apply(_format_data, network_df=network_df, axis=1)
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # TODO: Check if all keys in df match the keys in OUTPUT_DICT
 
@@ -147,7 +148,7 @@ def get_ppi(bridgedb_df: pd.DataFrame):
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     string_metadata = {
@@ -5,6 +5,7 @@
 
 import datetime
 import os
+import time
 import warnings
 from string import Template
 
@@ -74,7 +75,7 @@ def get_gene_literature(bridgedb_df: pd.DataFrame):
         return pd.DataFrame(), {}
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     wikidata_version = get_version_wikidata()
 
@@ -116,7 +117,7 @@ def get_gene_literature(bridgedb_df: pd.DataFrame):
         intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "article" not in intermediate_df.columns:
         return pd.DataFrame(), {"datasource": WIKIDATA, "metadata": wikidata_version}
@@ -154,7 +155,7 @@ def get_gene_literature(bridgedb_df: pd.DataFrame):
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     wikidata_metadata = {
@@ -187,7 +188,7 @@ def get_gene_cellular_component(bridgedb_df: pd.DataFrame):
         return pd.DataFrame(), {}
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     # Add version to metadata file
     wikidata_version = get_version_wikidata()
@@ -232,7 +233,7 @@ def get_gene_cellular_component(bridgedb_df: pd.DataFrame):
         intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "cellularComp" not in intermediate_df.columns:
         return pd.DataFrame(), {"datasource": WIKIDATA, "metadata": wikidata_version}
@@ -265,7 +266,7 @@ def get_gene_cellular_component(bridgedb_df: pd.DataFrame):
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     wikidata_metadata = {
@@ -6,7 +6,9 @@
 import datetime
 import logging
 import os
+import time
 import warnings
+from functools import lru_cache
 from string import Template
 
 import pandas as pd
@@ -23,6 +25,8 @@ from pyBiodatafuse.utils import (
     check_columns_against_constants,
     collapse_data_sources,
     get_identifier_of_interest,
+    load_query,
+    run_sparql_queries,
 )
 
 logger = logging.getLogger("wikipathways")
@@ -33,8 +37,7 @@ def check_endpoint_wikipathways() -> bool:
 
     :returns: True if the endpoint is available, False otherwise.
     """
-    with open(os.path.dirname(__file__) + "/queries/wikipathways-metadata.rq", "r") as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(os.path.dirname(__file__) + "/queries/wikipathways-metadata.rq")
 
     sparql = SPARQLWrapper(WIKIPATHWAYS_ENDPOINT)
     sparql.setReturnFormat(JSON)
@@ -48,13 +51,13 @@ def check_endpoint_wikipathways() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
 def get_version_wikipathways() -> dict:
     """Get version of WikiPathways.
 
     :returns: a dictionary containing the version information
     """
-    with open(os.path.dirname(__file__) + "/queries/wikipathways-metadata.rq", "r") as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(os.path.dirname(__file__) + "/queries/wikipathways-metadata.rq")
 
     sparql = SPARQLWrapper(WIKIPATHWAYS_ENDPOINT)
     sparql.setReturnFormat(JSON)
@@ -67,14 +70,15 @@ def get_version_wikipathways() -> dict:
     return wikipathways_version
 
 
-def get_gene_wikipathways(bridgedb_df: pd.DataFrame):
+def get_gene_wikipathways(bridgedb_df: pd.DataFrame, check_endpoint: bool = True):
     """Query WikiPathways for pathways associated with genes.
 
     :param bridgedb_df: BridgeDb output for creating the list of gene ids to query
+    :param check_endpoint: whether to check the availability of the WikiPathways SPARQL endpoint first
     :returns: a DataFrame containing the WikiPathways output and dictionary of the WikiPathways metadata.
     """
     # Check if the DisGeNET API is available
-    api_available = check_endpoint_wikipathways()
+    api_available = not check_endpoint or check_endpoint_wikipathways()
 
     if not api_available:
         warnings.warn(
@@ -86,8 +90,7 @@ def get_gene_wikipathways(bridgedb_df: pd.DataFrame):
     data_df = get_identifier_of_interest(bridgedb_df, WIKIPATHWAYS_INPUT_ID)
 
     wikipathways_version = get_version_wikipathways()
-    gene_list = data_df["target"].tolist()
-    gene_list = list(set(gene_list))
+    gene_list = list(dict.fromkeys(data_df["target"].tolist()))
 
     query_gene_lists = []
 
@@ -99,46 +102,38 @@ def get_gene_wikipathways(bridgedb_df: pd.DataFrame):
     else:
         query_gene_lists.append(" ".join(f'"{g}"' for g in gene_list))
 
-    with open(os.path.dirname(__file__) + "/queries/wikipathways-genes-pathways.rq", "r") as fin:
-        sparql_query = fin.read()
+    sparql_query = load_query(os.path.dirname(__file__) + "/queries/wikipathways-genes-pathways.rq")
+    sparql_query_template = Template(sparql_query)
 
     # Record the start time
-    start_time = datetime.datetime.now()
-
-    sparql = SPARQLWrapper(WIKIPATHWAYS_ENDPOINT)
-    sparql.setReturnFormat(JSON)
-
-    query_count = 0
-
-    intermediate_df = pd.DataFrame()
+    start_time = time.perf_counter()
 
+    queries = []
     for gene_list_str in query_gene_lists:
-        query_count += 1
-
-        sparql_query_template = Template(sparql_query)
         substit_dict = dict(gene_list=gene_list_str)
-        sparql_query_template_sub = sparql_query_template.substitute(substit_dict)
+        queries.append(sparql_query_template.substitute(substit_dict))
 
-        sparql.setQuery(sparql_query_template_sub)
-
-        res = sparql.queryAndConvert()
-
-        res = res["results"]["bindings"]
-
-        df = pd.DataFrame(res)
-        df = df.applymap(lambda x: x["value"])
+    results = run_sparql_queries(
+        WIKIPATHWAYS_ENDPOINT,
+        queries,
+        dtypes={"gene_id": str, "pathway_id": str, "pathway_label": str, "pathway_gene_count": int},
+    )
 
-        intermediate_df = pd.concat([intermediate_df, df], ignore_index=True)
+    intermediate_dfs = [df for df in results if not df.empty]
 
+    intermediate_df = (
+        pd.concat(intermediate_dfs, ignore_index=True, copy=False)
+        if intermediate_dfs
+        else pd.DataFrame()
+    )
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     if "gene_id" not in intermediate_df.columns:
         return pd.DataFrame(), {"datasource": WIKIPATHWAYS, "metadata": wikipathways_version}
 
     # Organize the annotation results as an array of dictionaries
     intermediate_df.rename(columns={"gene_id": "target"}, inplace=True)
-    intermediate_df["pathway_gene_count"] = pd.to_numeric(intermediate_df["pathway_gene_count"])
     intermediate_df = intermediate_df.drop_duplicates()
 
     # Check if all keys in df match the keys in OUTPUT_DICT
@@ -148,6 +143,10 @@ def get_gene_wikipathways(bridgedb_df: pd.DataFrame):
         check_values_in=["pathway_id"],
     )
 
+    # Pathways are shared by many genes, so store them as categories
+    intermediate_df["pathway_id"] = intermediate_df["pathway_id"].astype("category")
+    intermediate_df["pathway_label"] = intermediate_df["pathway_label"].astype("category")
+
     # Merge the two DataFrames on the target column
     merged_df = collapse_data_sources(
         data_df=data_df,
@@ -162,7 +161,7 @@ def get_gene_wikipathways(bridgedb_df: pd.DataFrame):
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
 
     # Add the datasource, query, query time, and the date to metadata
     wikipathways_metadata = {
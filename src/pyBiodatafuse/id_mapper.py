@@ -5,6 +5,7 @@
 import csv
 import datetime
 import logging
+import time
 from importlib import resources
 from typing import List, Optional, Tuple
 
@@ -133,7 +134,7 @@ def bridgedb_xref(
     query_link = f"{url}/{input_species}/xrefsBatch"
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     # Getting the response to the query
     try:
@@ -146,7 +147,7 @@ def bridgedb_xref(
     lines = out.split("\n")
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     # Processing each line and splitting values
     parsed_results = []
@@ -190,7 +191,7 @@ def bridgedb_xref(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add BridgeDb version to metadata file
     bridgedb_version = get_version_webservice_bridgedb()
     datasource_version = get_version_datasource_bridgedb()
@@ -265,7 +266,7 @@ def pubchem_xref(
         raise ValueError("Please provide at least one input.")
 
     # Record the start time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     # Getting the response to the query
     cid_data = []
@@ -281,7 +282,7 @@ def pubchem_xref(
         )
 
     # Record the end time
-    end_time = datetime.datetime.now()
+    end_time = time.perf_counter()
 
     pubchem_df = pd.DataFrame(cid_data)
     pubchem_df = pubchem_df.drop_duplicates()
@@ -290,7 +291,7 @@ def pubchem_xref(
     # Get the current date and time
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     # Calculate the time elapsed
-    time_elapsed = str(end_time - start_time)
+    time_elapsed = str(datetime.timedelta(seconds=end_time - start_time))
     # Add package version to metadata file
     stable_package_version = "1.0.4"  # Stable version for PubChemPy
 
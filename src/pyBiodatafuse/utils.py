@@ -2,10 +2,14 @@
 
 """Python utils file for global functions."""
 
+import io
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
 
 import pandas as pd
+from SPARQLWrapper import CSV, POST, SPARQLWrapper
 
 from pyBiodatafuse.id_mapper import read_resource_files
 
@@ -27,6 +31,42 @@ def get_identifier_of_interest(bridgedb_df: pd.DataFrame, db_source: str) -> pd.
     return bridgedb_df[bridgedb_df["target.source"] == db_source]
 
 
+@lru_cache(maxsize=None)
+def load_query(query_path: str) -> str:
+    """Read a SPARQL query file, caching its content for subsequent calls.
+
+    :param query_path: path to the SPARQL query file
+    :returns: the SPARQL query
+    """
+    with open(query_path, "r") as fin:
+        return fin.read()
+
+
+def run_sparql_queries(endpoint: str, queries: List[str], dtypes: dict) -> List[pd.DataFrame]:
+    """Run SPARQL queries concurrently and parse their CSV results.
+
+    :param endpoint: SPARQL endpoint to query
+    :param queries: list of SPARQL queries to run
+    :param dtypes: column types of the query results, so that pandas does not need to infer them
+    :returns: a list with a DataFrame of the results of each query, in the order of the queries
+    """
+
+    def run_query(sparql_query: str) -> pd.DataFrame:
+        sparql = SPARQLWrapper(endpoint)
+        sparql.setReturnFormat(CSV)
+        # POST keeps long queries out of the request URL
+        sparql.setMethod(POST)
+        sparql.setQuery(sparql_query)
+        res = sparql.query().response.read()
+
+        # Only empty fields are missing, values such as "NA" or "None" are kept as strings
+        return pd.read_csv(io.BytesIO(res), dtype=dtypes, keep_default_na=False, na_values=[""])
+
+    # Limit the number of parallel requests to the endpoint
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(run_query, queries))
+
+
 def create_or_append_to_metadata(data: dict, prev_entry: List[dict]) -> List[dict]:
     """Create and/or append data to a metadata file.
 
@@ -41,7 +81,7 @@ def create_or_append_to_metadata(data: dict, prev_entry: List[dict]) -> List[dic
             },
             "query": {
             "size": number_of_results_queried,
-            "time": time_taken_to_run_the_query,  (using datetime.datetime.now())
+            "time": time_taken_to_run_the_query,  (using time.perf_counter())
             "date": date_of_query,
             "url": url_of_query,
             "request_string": post_request_string (Optional)
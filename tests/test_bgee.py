@@ -12,7 +12,7 @@ import pandas as pd
 
 from pyBiodatafuse.annotators import bgee
 from pyBiodatafuse.annotators.bgee import get_gene_expression, get_version_bgee
-from pyBiodatafuse.constants import ANATOMICAL_ENTITIES_LIST, BGEE
+from pyBiodatafuse.constants import BGEE
 
 data_file_folder = os.path.join(os.path.dirname(__file__), "data")
 
@@ -40,18 +40,23 @@ class TestBgee(unittest.TestCase):
 
         assert obtained_version == expected_version
 
-    @patch("pyBiodatafuse.annotators.bgee.SPARQLWrapper.queryAndConvert")
+    @patch("pyBiodatafuse.utils.SPARQLWrapper.query")
     def test_get_gene_expression(self, mock_sparql_request):
         """Test the get_gene_expression function."""
         with open(os.path.join(data_file_folder, "bgee_mock_data.json")) as f:
             mock_data = json.load(f)
 
-        mock_data_list = []
-        for _ in range(len(ANATOMICAL_ENTITIES_LIST)):
-            for json_response in mock_data:
-                mock_data_list.append(pd.DataFrame.from_dict(json_response))
+        # All genes and anatomical entities are queried at once and the results are
+        # requested as CSV, so merge the mocked responses into a single CSV response
+        mock_response = pd.DataFrame(
+            [
+                {var: value["value"] for var, value in binding.items()}
+                for json_response in mock_data
+                for binding in json_response["results"]["bindings"]
+            ]
+        ).to_csv(index=False)
 
-        mock_sparql_request.side_effect = mock_data_list
+        mock_sparql_request.return_value.response.read.return_value = mock_response.encode()
         bgee.get_version_bgee = Mock(
             return_value={"source_version": "2023-11-01"}
         )  # Mock the version call
@@ -98,3 +103,30 @@ class TestBgee(unittest.TestCase):
 
         pd.testing.assert_series_equal(obtained_data[BGEE], expected_data)
         self.assertIsInstance(metadata, dict)
+
+    @patch("pyBiodatafuse.utils.SPARQLWrapper.query")
+    def test_get_gene_expression_without_endpoint_check(self, mock_sparql_request):
+        """Test that get_gene_expression skips the endpoint check when asked to."""
+        mock_sparql_request.return_value.response.read.return_value = (
+            b"ensembl_id,anatomical_entity_id,anatomical_entity_name,developmental_stage_id,"
+            b"developmental_stage_name,expression_level,confidence_level_id,confidence_level_name\n"
+        )
+        bgee.get_version_bgee = Mock(
+            return_value={"source_version": "2023-11-01"}
+        )  # Mock the version call
+        bgee.check_endpoint_bgee = Mock(return_value=False)
+
+        bridgedb_dataframe = pd.DataFrame(
+            {
+                "identifier": ["AGRN"],
+                "identifier.source": ["HGNC"],
+                "target": ["ENSG00000188157"],
+                "target.source": ["Ensembl"],
+            }
+        )
+
+        _, metadata = get_gene_expression(bridgedb_dataframe, check_endpoint=False)
+
+        bgee.check_endpoint_bgee.assert_not_called()
+        mock_sparql_request.assert_called_once()
+        self.assertEqual(metadata["datasource"], BGEE)
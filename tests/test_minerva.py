@@ -20,7 +20,7 @@ data_file_folder = os.path.join(os.path.dirname(__file__), "data")
 class TestMinerva(unittest.TestCase):
     """Test the MINERVA class."""
 
-    @patch("pyBiodatafuse.annotators.minerva.requests.get")
+    @patch("pyBiodatafuse.annotators.minerva.requests.Session.get")
     def test_get_version_minerva(self, mock_requests_get):
         """Test the get_version_minerva."""
         # Mocking the response from the MINERVA API
@@ -43,7 +43,7 @@ class TestMinerva(unittest.TestCase):
             mock_data = json.load(f)
 
         # Mock the request call in the function
-        minerva.get_version_bgee = Mock(return_value={"source_version": "16.4.1"})
+        minerva.get_version_minerva = Mock(return_value={"source_version": "16.4.1"})
         minerva.check_endpoint_minerva = Mock(return_value=True)
         minerva.get_minerva_components = Mock(
             return_value=("https://covid19map.elixir-luxembourg.org/minerva/", mock_data)
@@ -85,3 +85,60 @@ class TestMinerva(unittest.TestCase):
 
         pd.testing.assert_series_equal(obtained_df[MINERVA], expected_df)
         self.assertIsInstance(metadata, dict)
+
+    def test_get_gene_minerva_pathways_skips_reactions_by_default(self):
+        """Test that MINERVA reactions are not downloaded unless requested."""
+        with open(os.path.join(data_file_folder, "minerva_components.json")) as f:
+            mock_data = json.load(f)
+
+        minerva.get_version_minerva = Mock(return_value={"source_version": "16.4.1"})
+        minerva.check_endpoint_minerva = Mock(return_value=True)
+        minerva.get_minerva_components = Mock(
+            return_value=("https://covid19map.elixir-luxembourg.org/minerva/", mock_data)
+        )
+        minerva._MAP_VERSIONS.clear()
+
+        bridgedb_dataframe = pd.DataFrame(
+            {
+                "identifier": ["ABCG2"],
+                "identifier.source": ["HGNC"],
+                "target": ["ENSG00000118777"],
+                "target.source": ["Ensembl"],
+            }
+        )
+
+        get_gene_minerva_pathways(bridgedb_dataframe, "COVID19 Disease Map")
+
+        minerva.get_minerva_components.assert_called_once_with(
+            map_name="COVID19 Disease Map", get_elements=True, get_reactions=False
+        )
+
+    def test_get_gene_minerva_pathways_refreshes_on_new_version(self):
+        """Test that cached MINERVA components are downloaded again for a new MINERVA version."""
+        with open(os.path.join(data_file_folder, "minerva_components.json")) as f:
+            mock_data = json.load(f)
+
+        minerva.check_endpoint_minerva = Mock(return_value=True)
+        minerva.get_minerva_components = Mock(
+            return_value=("https://covid19map.elixir-luxembourg.org/minerva/", mock_data)
+        )
+        minerva._MAP_VERSIONS.clear()
+
+        bridgedb_dataframe = pd.DataFrame(
+            {
+                "identifier": ["ABCG2"],
+                "identifier.source": ["HGNC"],
+                "target": ["ENSG00000118777"],
+                "target.source": ["Ensembl"],
+            }
+        )
+
+        minerva.get_version_minerva = Mock(return_value={"source_version": "16.4.1"})
+        get_gene_minerva_pathways(bridgedb_dataframe, "COVID19 Disease Map")
+        get_gene_minerva_pathways(bridgedb_dataframe, "COVID19 Disease Map")
+        minerva.get_minerva_components.cache_clear.assert_not_called()
+
+        minerva.get_version_minerva = Mock(return_value={"source_version": "17.0.0"})
+        get_gene_minerva_pathways(bridgedb_dataframe, "COVID19 Disease Map")
+        minerva.get_minerva_components.cache_clear.assert_called_once()
+        self.assertEqual(minerva.get_minerva_components.call_count, 4)
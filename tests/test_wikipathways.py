@@ -39,51 +39,14 @@ class TestWikipathway(unittest.TestCase):
 
         assert obtained_version == expected_version
 
-    @patch("pyBiodatafuse.annotators.wikipathways.SPARQLWrapper.queryAndConvert")
+    @patch("pyBiodatafuse.utils.SPARQLWrapper.query")
     def test_get_gene_wikipathways(self, mock_sparql_request):
         """Test the get_gene_wikipathways."""
-        mock_sparql_request.side_effect = [
-            {
-                "head": {
-                    "link": [],
-                    "vars": ["gene_id", "pathway_id", "pathway_label", "pathway_gene_count"],
-                },
-                "results": {
-                    "distinct": False,
-                    "ordered": True,
-                    "bindings": [
-                        {
-                            "gene_id": {"type": "literal", "value": "85365"},
-                            "pathway_id": {"type": "literal", "value": "WP5153"},
-                            "pathway_label": {
-                                "type": "literal",
-                                "xml:lang": "en",
-                                "value": "N-glycan biosynthesis",
-                            },
-                            "pathway_gene_count": {
-                                "type": "typed-literal",
-                                "datatype": "http: //www.w3.org/2001/XMLSchema#integer",
-                                "value": "57",
-                            },
-                        },
-                        {
-                            "gene_id": {"type": "literal", "value": "199857"},
-                            "pathway_id": {"type": "literal", "value": "WP5153"},
-                            "pathway_label": {
-                                "type": "literal",
-                                "xml:lang": "en",
-                                "value": "N-glycan biosynthesis",
-                            },
-                            "pathway_gene_count": {
-                                "type": "typed-literal",
-                                "datatype": "http://www.w3.org/2001/XMLSchema#integer",
-                                "value": "57",
-                            },
-                        },
-                    ],
-                },
-            }
-        ]
+        mock_sparql_request.return_value.response.read.return_value = (
+            b"gene_id,pathway_id,pathway_label,pathway_gene_count\n"
+            b"85365,WP5153,N-glycan biosynthesis,57\n"
+            b"199857,WP5153,N-glycan biosynthesis,57\n"
+        )
 
         wikipathways.get_version_wikipathways = Mock(
             return_value={"source_version": "WikiPathways RDF 20240310"}
@@ -124,3 +87,58 @@ class TestWikipathway(unittest.TestCase):
 
         pd.testing.assert_series_equal(obtained_data[WIKIPATHWAYS], expected_data)
         self.assertIsInstance(metadata, dict)
+
+    @patch("pyBiodatafuse.utils.SPARQLWrapper.query")
+    def test_get_gene_wikipathways_na_strings(self, mock_sparql_request):
+        """Test that values spelled like missing values are kept as strings."""
+        mock_sparql_request.return_value.response.read.return_value = (
+            b"gene_id,pathway_id,pathway_label,pathway_gene_count\n85365,WP1,None,3\n"
+        )
+
+        wikipathways.get_version_wikipathways = Mock(
+            return_value={"source_version": "WikiPathways RDF 20240310"}
+        )  # Mock the version call
+        wikipathways.check_endpoint_wikipathways = Mock(return_value=True)
+
+        bridgedb_dataframe = pd.DataFrame(
+            {
+                "identifier": ["ALG2"],
+                "identifier.source": ["HGNC"],
+                "target": ["85365"],
+                "target.source": ["NCBI Gene"],
+            }
+        )
+
+        obtained_data, _ = get_gene_wikipathways(bridgedb_dataframe)
+
+        self.assertEqual(
+            obtained_data[WIKIPATHWAYS][0],
+            [{"pathway_id": "WP1", "pathway_label": "None", "pathway_gene_count": 3}],
+        )
+
+    @patch("pyBiodatafuse.utils.SPARQLWrapper.query")
+    def test_get_gene_wikipathways_without_endpoint_check(self, mock_sparql_request):
+        """Test that get_gene_wikipathways skips the endpoint check when asked to."""
+        mock_sparql_request.return_value.response.read.return_value = (
+            b"gene_id,pathway_id,pathway_label,pathway_gene_count\n"
+        )
+
+        wikipathways.get_version_wikipathways = Mock(
+            return_value={"source_version": "WikiPathways RDF 20240310"}
+        )  # Mock the version call
+        wikipathways.check_endpoint_wikipathways = Mock(return_value=False)
+
+        bridgedb_dataframe = pd.DataFrame(
+            {
+                "identifier": ["ALG2"],
+                "identifier.source": ["HGNC"],
+                "target": ["85365"],
+                "target.source": ["NCBI Gene"],
+            }
+        )
+
+        _, metadata = get_gene_wikipathways(bridgedb_dataframe, check_endpoint=False)
+
+        wikipathways.check_endpoint_wikipathways.assert_not_called()
+        mock_sparql_request.assert_called_once()
+        self.assertEqual(metadata["datasource"], WIKIPATHWAYS)